@@ -1,6 +1,9 @@
 # preview.py
 import html
-from typing import List, Dict
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 import tkinter as tk
 from tkinter import ttk
 
@@ -11,6 +14,28 @@ try:
 except Exception:
     _WEB_AVAILABLE = False
 
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_HTML_PAGE = 200  # rows per HTML page; later pages are appended as the user scrolls
+_TREE_BULK_ROWS = 100  # fallback Treeview: detach while (re)filling at least this many rows
+_PDF_PROGRESS_ROWS = 50  # export_pdf progress callback granularity
+
+# Core PDF fonts are ASCII-only here: map the few dashes/bullets we emit, drop the rest
+_PDF_TRANSLATE = str.maketrans({"—": "-", "–": "-", "•": "*"})
+
+# File state -> badge (HTML) / fill color (PDF); unknown states use the "" entry
+_BADGE_HTML = {
+    "green": "<span class='badge' style='background:#10B981;color:#ffffff;'>GREEN</span>",
+    "amber": "<span class='badge' style='background:#F59E0B;color:#000000;'>AMBER</span>",
+    "red":   "<span class='badge' style='background:#EF4444;color:#ffffff;'>RED</span>",
+    "":      "<span class='badge' style='background:#e5e7eb;color:#111827;'>—</span>",
+}
+_BADGE_RGB = {
+    "green": (16, 185, 129),   # #10B981
+    "amber": (245, 158, 11),   # #F59E0B
+    "red":   (239, 68, 68),    # #EF4444
+    "":      (229, 231, 235),  # neutral
+}
+
 
 class FilePreview:
     """
@@ -48,6 +73,8 @@ class FilePreview:
     def __init__(self, parent, theme: str = "light") -> None:
         self.parent = parent
         self.theme = theme
+        self._last_render_key: tuple | None = None
+        self._last_rows: List[Dict] = []
         if _WEB_AVAILABLE:
             # Single source of scrollbars: HtmlFrame itself
             self.widget = HtmlFrame(
@@ -56,6 +83,9 @@ class FilePreview:
                 vertical_scrollbar="auto",
                 horizontal_scrollbar="auto",
             )
+            self._html_pending: Iterator[Dict] | None = None  # rows not yet in the document
+            self._html_append_queued = False
+            self._html_paged = self._hook_html_scroll()
             self._html_mode = True
         else:
             frame = ttk.Frame(parent)
@@ -66,6 +96,7 @@ class FilePreview:
             sb = ttk.Scrollbar(frame, orient="vertical", command=self._tree.yview)
             sb.pack(side="right", fill="y")
             self._tree.configure(yscrollcommand=sb.set)
+            self._tree_sb = sb
 
             for key, title, width, anchor in [
                 ("file_path", "File path", 520, "w"),
@@ -79,21 +110,58 @@ class FilePreview:
                 self._tree.heading(key, text=title)
                 self._tree.column(key, width=width, anchor=anchor)
 
+            self._tree_iids: list[str] = []  # item pool reused across renders
+            self._tree_shown = 0               # how many pool items are attached
             self._html_mode = False
 
     # ---------------- Public API ----------------
-    def render(self, rows: List[Dict]) -> None:
+    def render(self, rows: Iterable[Dict]) -> None:
+        # Refreshes that change nothing (resize, re-save of the same config) skip
+        # the rebuild; compared by value, so a hash collision can't hide an update.
+        rows = list(rows)
+        key = tuple(tuple(map(r.get, self.COLUMNS)) for r in rows)
+        if key == self._last_render_key:
+            return
+        self._last_render_key = key
+        self._last_rows = rows
         if self._html_mode:
             self._render_html(rows)
         else:
             self._render_tree(rows)
 
-    def export_pdf(self, out_path: str, rows: list[dict]) -> None:
+    def append_row(self, row: Dict) -> None:
+        """Add one row after those of the last render without rebuilding the table."""
+        if not self._last_render_key:
+            # Nothing shown yet (or only the empty-state message): plain render
+            self.render([row])
+            return
+        rows = self._last_rows + [row]
+        if self._html_mode:
+            if self._html_pending is not None:
+                # Later pages aren't in the document yet; queue behind them
+                self._html_pending = chain(self._html_pending, (row,))
+            elif self._html_paged:
+                inner = self.widget.html
+                tb = self.widget.document.getElementById("tb")
+                inner.insert_node(tb.node, inner.parse_fragment("".join(self._rows_html((row,)))))
+            else:
+                self.render(rows)
+                return
+        else:
+            self._tree_append(_tree_values(row))
+        self._last_render_key += (tuple(map(row.get, self.COLUMNS)),)
+        self._last_rows = rows
+
+    def export_pdf(self, out_path: str, rows: Iterable[Dict],
+                   progress: Callable[[int], None] | None = None) -> None:
         """
         Vector PDF:
         - No MultiCell; manual wrap with explicit (x,y) drawing to prevent overlaps.
         - Two-pass per header & row: measure -> draw borders -> paint text.
+        - Borders: one rule per row, column lines stroked once per page.
         - 'File state' as a color badge (no text).
+        - progress(rows_done) is called every _PDF_PROGRESS_ROWS rows and at the end;
+          raising from it aborts the export before anything is written.
         """
         from fpdf import FPDF  # pip install fpdf2
 
@@ -104,7 +172,8 @@ class FilePreview:
 
         pdf = FPDF(orientation="L", unit="mm", format="A4")
         pdf.set_margins(10, 12, 10)
-        pdf.set_auto_page_break(auto=True, margin=12)
+        # Page breaks are ours (see add_row), so every page gets its column rules
+        pdf.set_auto_page_break(auto=False, margin=12)
         pdf.add_page()
 
         printable_w = pdf.w - pdf.l_margin - pdf.r_margin
@@ -113,41 +182,47 @@ class FilePreview:
         # -------- helpers --------
         def sanitize(s):
             if s is None: return ""
-            s = str(s).replace("—","-").replace("–","-").replace("•","*")
-            return s.encode("ascii","ignore").decode("ascii")
-
-        def human_size(n):
-            if n in (None, "", "—"):
-                return "-"
-            try: n = int(n)
-            except Exception: return "-"
-            units = ["B","KB","MB","GB","TB"]; i = 0; f = float(n)
-            while f >= 1024 and i < len(units)-1:
-                f /= 1024.0; i += 1
-            return f"{f:.1f} {units[i]}"
+            return str(s).translate(_PDF_TRANSLATE).encode("ascii","ignore").decode("ascii")
+
+        char_w = {}  # font_bold -> {char: width} for ASCII, measured once per export
+        # Per-export memo of wrapped lines / heights; rows repeat paths, names and '—' a lot
+        wrap_cache: dict[tuple, list[str]] = {}
+        height_cache: dict[tuple, float] = {}
 
         def wrap_lines(text: str, width: float, *, font_bold=False) -> list[str]:
             """Return a list of wrapped lines that fit within 'width' without drawing."""
-            text = sanitize(text)
             pdf.set_font("Helvetica", style=("B" if font_bold else ""), size=(11 if font_bold else 10))
+            key = (text, width, font_bold)
+            cached = wrap_cache.get(key)
+            if cached is not None:
+                return cached
+            wrap_cache[key] = lines = _wrap(sanitize(text), width, font_bold)
+            return lines
+
+        def _wrap(text: str, width: float, font_bold: bool) -> list[str]:
             if not text:
                 return [""]
-            lines = []
-            cur = ""
-            cur_w = 0.0
+            cw_map = char_w.get(font_bold)
+            if cw_map is None:
+                # sanitize() leaves ASCII only, so this covers every char we'll see
+                cw_map = char_w[font_bold] = {chr(c): pdf.get_string_width(chr(c)) for c in range(128)}
             max_w = max(1e-3, width)
+            lines = []
 
-            for ch in text:
-                if ch == "\n":
-                    lines.append(cur); cur = ""; cur_w = 0.0
+            for para in text.split("\n"):
+                if not para:
+                    lines.append("")
                     continue
-                w = pdf.get_string_width(ch)
-                if cur_w + w > max_w and cur:
-                    lines.append(cur)
-                    cur, cur_w = ch, w
-                else:
-                    cur += ch; cur_w += w
-            lines.append(cur)
+                # Prefix sums of char widths (C-level accumulate); each break is then
+                # one bisect: the longest run from i whose width fits in max_w.
+                cum = list(accumulate(map(cw_map.__getitem__, para), initial=0.0))
+                i, n = 0, len(para)
+                while i < n:
+                    j = bisect_right(cum, cum[i] + max_w, i + 1) - 1
+                    if j <= i:
+                        j = i + 1  # a single char wider than the cell still gets a line
+                    lines.append(para[i:j])
+                    i = j
             return lines
 
         def draw_text_block(x, y, w, h, text, *, font_bold=False, align="L"):
@@ -162,49 +237,63 @@ class FilePreview:
                 pdf.cell(w, LINE_H, line, border=0, align=align)
 
         def draw_state_badge(x, y, w, h, state):
-            s = (state or "").lower()
-            if s == "green": pdf.set_fill_color(16,185,129)   # #10B981
-            elif s == "amber": pdf.set_fill_color(245,158,11) # #F59E0B
-            elif s == "red": pdf.set_fill_color(239,68,68)    # #EF4444
-            else: pdf.set_fill_color(229,231,235)             # neutral
-            # outer border
-            pdf.rect(x, y, w, h, style="D")
-            # inner fill
+            pdf.set_fill_color(*_BADGE_RGB.get((state or "").lower(), _BADGE_RGB[""]))
+            # inner fill (the cell border comes from the table rules)
             inset = 1.2
             pdf.rect(x+inset, y+inset, max(0.1, w-2*inset), max(0.1, h-2*inset), style="F")
 
         def measure_block_height(text, w, *, font_bold=False) -> float:
             """Height needed to draw 'text' in width 'w' using our manual wrapping."""
-            lines = wrap_lines(text, w, font_bold=font_bold)
-            return max(LINE_H, len(lines) * LINE_H)
+            key = (text, w, font_bold)
+            h = height_cache.get(key)
+            if h is None:
+                lines = wrap_lines(text, w, font_bold=font_bold)
+                height_cache[key] = h = max(LINE_H, len(lines) * LINE_H)
+            return h
+
+        # Table rules: one horizontal line under each row, and the column
+        # verticals stroked once per page (instead of a rect per cell).
+        table_x = [pdf.l_margin]
+        for w in col_w:
+            table_x.append(table_x[-1] + w)
+        page_top = 0.0
+        header_bottom = 0.0
+        page_bottom = pdf.h - pdf.b_margin
+
+        def close_page_rules():
+            y = pdf.get_y()
+            for x in table_x:
+                pdf.line(x, page_top, x, y)
 
         def page_maybe_add_header():
             if pdf.get_y() > (pdf.h - pdf.b_margin - 12):
+                close_page_rules()
                 pdf.add_page()
                 add_header()
 
         # -------- header (measure -> border -> text) --------
         def add_header():
+            nonlocal page_top, header_bottom
             x0, y0 = pdf.get_x(), pdf.get_y()
             heights = [measure_block_height(h, col_w[i], font_bold=True) for i, h in enumerate(headers)]
             row_h = max(heights)
-            # borders
-            x = x0
-            for w in col_w:
-                pdf.rect(x, y0, w, row_h)
-                x += w
+            # borders: top of table + bottom of header row
+            page_top = y0
+            pdf.line(table_x[0], y0, table_x[-1], y0)
+            pdf.line(table_x[0], y0 + row_h, table_x[-1], y0 + row_h)
             # text
             x = x0
             for i, htxt in enumerate(headers):
                 draw_text_block(x, y0, col_w[i], row_h, htxt, font_bold=True, align="L")
                 x += col_w[i]
             # move
-            pdf.set_xy(x0, y0 + row_h)
+            header_bottom = y0 + row_h
+            pdf.set_xy(x0, header_bottom)
             pdf.set_font("Helvetica", size=10)
 
         # -------- row (measure -> border -> text) --------
         def add_row(vals):
-            vals = [sanitize(v) for v in vals]
+            vals = tuple(map(sanitize, vals))
             x0, y0 = pdf.get_x(), pdf.get_y()
 
             # measure (wrap path & name; others single line)
@@ -219,11 +308,17 @@ class FilePreview:
             ]
             row_h = max(heights)
 
-            # borders for full row
-            x = x0
-            for w in col_w:
-                pdf.rect(x, y0, w, row_h)
-                x += w
+            # A row that doesn't fit starts a new page instead of being split
+            if y0 + row_h > page_bottom and y0 > header_bottom:
+                close_page_rules()
+                pdf.add_page()
+                add_header()
+                x0, y0 = pdf.get_x(), pdf.get_y()
+            # Taller than a whole page: clip to the page (text past it isn't drawn)
+            row_h = min(row_h, page_bottom - y0)
+
+            # border: bottom rule only (verticals are drawn per page)
+            pdf.line(table_x[0], y0 + row_h, table_x[-1], y0 + row_h)
 
             # text cells
             x = x0
@@ -242,72 +337,190 @@ class FilePreview:
 
         # -------- render --------
         add_header()
+        done = 0
         for r in rows:
-            add_row([
+            add_row((
                 r.get("file_path", ""),
-                human_size(r.get("file_size", None)),
+                _human_size(r.get("file_size", None)),  # "—" becomes "-" in sanitize
                 r.get("last_modified", ""),
                 r.get("last_worked_by", "—"),
                 r.get("file_name", ""),
                 r.get("file_neglect_time", "—"),
                 r.get("file_state", ""),  # color key only
-            ])
+            ))
+            done += 1
+            if progress and done % _PDF_PROGRESS_ROWS == 0:
+                progress(done)
+        close_page_rules()
+        if progress:
+            progress(done)
 
         pdf.output(out_path)
 
 
     # ---------------- HTML mode ----------------
-    def _render_html(self, rows: List[Dict]) -> None:
+    def _render_html(self, rows: Iterable[Dict]) -> None:
+        rows = iter(rows)
+        if self._html_paged:
+            # Only the first page goes into the document; the rest is pulled on scroll
+            first = list(islice(rows, _HTML_PAGE))
+            self._html_pending = rows if len(first) == _HTML_PAGE else None
+        else:
+            first = rows
+        trs = self._rows_html(first)
+        if not trs:
+            trs.append("<tr><td class='empty' colspan='7'>No folders yet. Add one above.</td></tr>")
+        self._load_html_doc(trs)
+
+    def _load_html_doc(self, trs: List[str]) -> None:
+        prefix, suffix = _html_shell(self.theme)
+        html_doc = prefix + "".join(trs) + suffix
+
+        if hasattr(self.widget, "load_html"):
+            self.widget.load_html(html_doc)
+        elif hasattr(self.widget, "add_html"):
+            self.widget.load_html("<!doctype html><html><body></body></html>")
+            self.widget.add_html(html_doc)
+        else:
+            setter = getattr(self.widget, "set_html", None)
+            if callable(setter):
+                setter(html_doc)
+            else:
+                raise RuntimeError("No supported method to set HTML in HtmlFrame.")
+
+    def _rows_html(self, rows: Iterable[Dict]) -> List[str]:
+        escape = html.escape
+
         def h(s) -> str:
-            return html.escape("" if s is None else str(s))
-
-        def human_size(n) -> str:
-            if n in (None, "", "—"):
-                return "—"
-            try:
-                n = int(n)
-            except Exception:
-                return "—"
-            units = ["B", "KB", "MB", "GB", "TB"]
-            i = 0
-            f = float(n)
-            while f >= 1024 and i < len(units) - 1:
-                f /= 1024.0
-                i += 1
-            return f"{f:.1f} {units[i]}"
+            return "" if s is None else escape(str(s))
 
         def state_badge(state: str) -> str:
-            s = (state or "").lower()
-            if s == "green":  bg, fg, label = "#10B981", "#ffffff", "GREEN"
-            elif s == "amber": bg, fg, label = "#F59E0B", "#000000", "AMBER"
-            elif s == "red":   bg, fg, label = "#EF4444", "#ffffff", "RED"
-            else:              bg, fg, label = "#e5e7eb", "#111827", "—"
-            return f"<span class='badge' style='background:{bg};color:{fg};'>{label}</span>"
+            return _BADGE_HTML.get((state or "").lower(), _BADGE_HTML[""])
 
         trs = []
+        trs_append = trs.append
         for r in rows:
-            trs.append(
-                "<tr>"
-                f"<td class='path'>{h(r.get('file_path'))}</td>"
-                f"<td class='size'>{h(human_size(r.get('file_size')))}</td>"
-                f"<td class='ts'>{h(r.get('last_modified'))}</td>"
-                f"<td class='user'>{h(r.get('last_worked_by'))}</td>"
-                f"<td class='name'>{h(r.get('file_name'))}</td>"
-                f"<td class='neglect'>{h(r.get('file_neglect_time'))}</td>"
-                f"<td class='state'>{state_badge(r.get('file_state'))}</td>"
-                "</tr>"
+            get = r.get
+            path, size, ts, user, name, neglect, state = (
+                get("file_path"), get("file_size"), get("last_modified"), get("last_worked_by"),
+                get("file_name"), get("file_neglect_time"), get("file_state"),
             )
-        if not trs:
-            trs.append("<tr><td class='empty' colspan='7'>No folders yet. Add one above.</td></tr>")
+            trs_append("".join((
+                "<tr><td class='path'>", h(path),
+                "</td><td class='size'>", h(_human_size(size)),
+                "</td><td class='ts'>", h(ts),
+                "</td><td class='user'>", h(user),
+                "</td><td class='name'>", h(name),
+                "</td><td class='neglect'>", h(neglect),
+                "</td><td class='state'>", state_badge(state),
+                "</td></tr>",
+            )))
+        return trs
+
+    def _hook_html_scroll(self) -> bool:
+        """
+        Chain onto the HtmlFrame's yscrollcommand to notice when the view hits the bottom.
+        Returns False if this tkinterweb can't append into the DOM (render everything at once).
+        """
+        inner = getattr(self.widget, "html", None)
+        if not (hasattr(inner, "parse_fragment") and hasattr(inner, "insert_node")
+                and hasattr(self.widget, "document")):
+            return False
+        try:
+            orig = inner.tk.splitlist(inner.cget("yscrollcommand"))
+        except Exception:
+            return False
+
+        def on_yscroll(first, last):
+            if orig:
+                inner.tk.call(*orig, first, last)
+            if self._html_pending is not None and not self._html_append_queued and float(last) >= 0.98:
+                self._html_append_queued = True
+                self.widget.after_idle(self._append_html_page)
+
+        inner.configure(yscrollcommand=on_yscroll)
+        return True
+
+    def _append_html_page(self) -> None:
+        self._html_append_queued = False
+        if self._html_pending is None:
+            return
+        chunk = list(islice(self._html_pending, _HTML_PAGE))
+        if len(chunk) < _HTML_PAGE:
+            self._html_pending = None
+        if not chunk:
+            return
+        inner = self.widget.html
+        tb = self.widget.document.getElementById("tb")
+        inner.insert_node(tb.node, inner.parse_fragment("".join(self._rows_html(chunk))))
+
+    # ---------------- Fallback Treeview ----------------
+    def _render_tree(self, rows: Iterable[Dict]) -> None:
+        # Reuse the item pool instead of delete-all + reinsert on every render:
+        # existing items get their values rewritten, surplus ones are detached
+        # (kept for the next render), and only rows beyond the pool are inserted.
+        # Talk to the Tk core directly; skips ttk.Treeview's option munging per row
+        _call = self._tree.tk.call
+        _w = str(self._tree)
+        iids = self._tree_iids
+        shown = self._tree_shown
+        # Format every row up front so the Tcl loop below does nothing else
+        values = [_tree_values(r) for r in rows]
+        # Big batch: take the tree out of the layout (and unhook the scrollbar) so Tk
+        # doesn't relayout/redraw per item; small renders skip this to avoid flicker.
+        bulk = len(values) >= _TREE_BULK_ROWS
+        if bulk:
+            self._tree.configure(yscrollcommand="")
+            self._tree.pack_forget()
+        pooled = len(iids)
+        for n, vals in enumerate(values):
+            if n < pooled:
+                _call(_w, "item", iids[n], "-values", vals)
+                if n >= shown:  # was detached by an earlier, shorter render
+                    _call(_w, "move", iids[n], "", "end")
+            else:
+                iids.append(_call(_w, "insert", "", "end", "-values", vals))
+        n = len(values)
+        if n < shown:
+            self._tree.detach(*iids[n:shown])
+        self._tree_shown = n
+        if bulk:
+            self._tree.pack(side="left", fill="both", expand=True, before=self._tree_sb)
+            self._tree.configure(yscrollcommand=self._tree_sb.set)
+
+    def _tree_append(self, vals: tuple) -> None:
+        n = self._tree_shown
+        if n < len(self._tree_iids):  # reuse a detached pool item
+            self._tree.item(self._tree_iids[n], values=vals)
+            self._tree.move(self._tree_iids[n], "", "end")
+        else:
+            self._tree_iids.append(self._tree.insert("", "end", values=vals))
+        self._tree_shown = n + 1
+
+
+def _tree_values(r: Dict) -> tuple:
+    return (
+        r.get("file_path", ""),
+        _human_size(r.get("file_size", None)),
+        r.get("last_modified", ""),
+        r.get("last_worked_by", "—"),
+        r.get("file_name", ""),
+        r.get("file_neglect_time", "—"),
+        (r.get("file_state", "") or "").upper(),
+    )
 
-        bg = "#ffffff" if self.theme == "light" else "#0f1014"
-        text = "#000000" if self.theme == "light" else "#e9ecf1"
-        muted = "#444444" if self.theme == "light" else "#9aa3ad"
-        border = "#e5e7eb" if self.theme == "light" else "#262b35"
-        header_bg = "#ffffff" if self.theme == "light" else "#151922"
 
-        # IMPORTANT: .table-wrap has NO overflow; HtmlFrame owns scrollbars
-        html_doc = f"""<!doctype html>
+@lru_cache(maxsize=2)
+def _html_shell(theme: str) -> Tuple[str, str]:
+    """Document text before and after the <tbody> rows for a theme (built once)."""
+    bg = "#ffffff" if theme == "light" else "#0f1014"
+    text = "#000000" if theme == "light" else "#e9ecf1"
+    muted = "#444444" if theme == "light" else "#9aa3ad"
+    border = "#e5e7eb" if theme == "light" else "#262b35"
+    header_bg = "#ffffff" if theme == "light" else "#151922"
+
+    # IMPORTANT: .table-wrap has NO overflow; HtmlFrame owns scrollbars
+    prefix = f"""<!doctype html>
 <html>
 <head>
 <meta charset="utf-8">
@@ -361,42 +574,16 @@ td.empty {{ color:{muted}; text-align:center; padding:18px; white-space:normal;
             <th>File state</th>
           </tr>
         </thead>
-        <tbody>
-          {''.join(trs)}
+        <tbody id="tb">
+          """
+    suffix = """
         </tbody>
       </table>
     </div>
   </div>
 </body>
 </html>"""
-
-        if hasattr(self.widget, "load_html"):
-            self.widget.load_html(html_doc)
-        elif hasattr(self.widget, "add_html"):
-            self.widget.load_html("<!doctype html><html><body></body></html>")
-            self.widget.add_html(html_doc)
-        else:
-            setter = getattr(self.widget, "set_html", None)
-            if callable(setter):
-                setter(html_doc)
-            else:
-                raise RuntimeError("No supported method to set HTML in HtmlFrame.")
-
-    # ---------------- Fallback Treeview ----------------
-    def _render_tree(self, rows: List[Dict]) -> None:
-        for i in self._tree.get_children():
-            self._tree.delete(i)
-        for r in rows:
-            vals = (
-                r.get("file_path", ""),
-                _human_size(r.get("file_size", None)),
-                r.get("last_modified", ""),
-                r.get("last_worked_by", "—"),
-                r.get("file_name", ""),
-                r.get("file_neglect_time", "—"),
-                (r.get("file_state", "") or "").upper(),
-            )
-            self._tree.insert("", "end", values=vals)
+    return prefix, suffix
 
 
 def _human_size(n) -> str:
@@ -406,10 +593,6 @@ def _human_size(n) -> str:
         n = int(n)
     except Exception:
         return "—"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    f = float(n)
-    while f >= 1024 and i < len(units) - 1:
-        f /= 1024.0
-        i += 1
-    return f"{f:.1f} {units[i]}"
+    # Unit index straight from the bit length (1 KB = 2**10), no divide loop
+    i = min((n.bit_length() - 1) // 10, len(_UNITS) - 1) if n > 0 else 0
+    return f"{n / (1 << (10 * i)):.1f} {_UNITS[i]}"
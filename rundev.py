@@ -7,6 +7,7 @@ import os
 import sys
 import time
 import subprocess
+import threading
 from pathlib import Path
 
 PROJECT_DIR = Path(__file__).resolve().parent
@@ -60,26 +61,25 @@ SW_MINIMIZE         = 6   # minimize (may activate another window)
 
 HWND_BOTTOM = wintypes.HWND(1)
 
-def _enum_windows():
-    hwnds = []
-    @EnumWindowsProc
-    def cb(hwnd, lparam):
-        hwnds.append(hwnd)
-        return True
-    EnumWindows(cb, 0)
-    return hwnds
-
 def _pid_for_hwnd(hwnd):
     pid = wintypes.DWORD(0)
     GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
     return pid.value
 
+# One module-level callback (built once). Each call's (pid, results) pair travels
+# in lParam, so the watcher thread and the main thread never share a result list.
+@EnumWindowsProc
+def _match_pid_cb(hwnd, lparam):
+    pid, found = ctypes.cast(lparam, ctypes.py_object).value
+    if _pid_for_hwnd(hwnd) == pid and IsWindowVisible(hwnd):
+        found.append(hwnd)
+        return False  # first visible window is all callers use; stop enumerating
+    return True
+
 def find_top_windows_for_pid(pid):
-    result = []
-    for hwnd in _enum_windows():
-        if _pid_for_hwnd(hwnd) == pid and IsWindowVisible(hwnd):
-            result.append(hwnd)
-    return result
+    state = (pid, [])  # kept alive by this frame for the whole EnumWindows call
+    EnumWindows(_match_pid_cb, id(state))
+    return state[1]
 
 def get_rect(hwnd):
     rect = wintypes.RECT()
@@ -104,15 +104,57 @@ def _has_watchdog():
     except Exception:
         return False
 
-def _iter_py_files():
-    for p in PROJECT_DIR.rglob("*.py"):
-        parts = {part.lower() for part in p.parts}
-        if "venv" in parts or ".venv" in parts:
-            continue
-        yield p
+def _dir_mtime(d):
+    try:
+        return os.stat(d).st_mtime
+    except OSError:
+        return None
 
-def _snapshot():
-    return {str(p): p.stat().st_mtime for p in _iter_py_files()}
+def _scan_dir(d):
+    """List one directory: (subdirs, *.py files), skipping venvs."""
+    subdirs, files = [], []
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                name = e.name.lower()
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if name not in ("venv", ".venv"):
+                            subdirs.append(e.path)
+                    elif name.endswith(".py"):
+                        files.append(e.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return subdirs, files
+
+def _update_tree(tree):
+    """
+    tree maps dir -> (mtime, [*.py]). Check coarse, drill fine: one stat per known
+    dir, and only dirs whose mtime moved (entry added/removed/renamed) are re-listed.
+    """
+    stack = [d for d, (mt, _) in tree.items() if _dir_mtime(d) != mt]
+    while stack:
+        d = stack.pop()
+        mt = _dir_mtime(d)
+        if mt is None:  # directory is gone
+            tree.pop(d, None)
+            continue
+        subdirs, files = _scan_dir(d)
+        tree[d] = (mt, files)
+        stack.extend(sd for sd in subdirs if sd not in tree)
+
+def _snapshot(tree):
+    # In-place edits don't touch the dir mtime, so known files are still stat'ed
+    snap = {}
+    for _, files in tree.values():
+        for f in files:
+            try:
+                snap[f] = os.stat(f).st_mtime
+            except OSError:
+                pass
+    return snap
 
 # ---------------------- Runner ----------------------
 def run_loop():
@@ -183,29 +225,43 @@ def run_loop():
         from watchdog.observers import Observer
         from watchdog.events import FileSystemEventHandler
         class H(FileSystemEventHandler):
-            def __init__(self): self._last=0
+            def __init__(self): self._t=None; self._path=None; self._lock=threading.Lock(); self._closed=False
             def _hit(self, path):
-                now=time.time()
-                if now-self._last<0.25: return
-                self._last=now
-                print(f"🔁 Change: {path}")
-                _stop(); _start()
+                # Coalesce a burst of events into one restart, 0.3s after the last one
+                self._path=path
+                if self._t: self._t.cancel()
+                self._t=threading.Timer(0.30, self._fire)
+                self._t.daemon=True
+                self._t.start()
+            def _fire(self):
+                with self._lock:  # a restart still in progress finishes before the next
+                    if self._closed: return  # shutting down; don't spawn a new child
+                    print(f"🔁 Change: {self._path}")
+                    _stop(); _start()
             def on_modified(self,e):
                 if not e.is_directory and e.src_path.lower().endswith(".py"): self._hit(e.src_path)
             on_created=on_moved=on_deleted=on_modified
-        obs=Observer(); obs.schedule(H(), str(PROJECT_DIR), recursive=True); obs.start()
+        h=H(); obs=Observer(); obs.schedule(h, str(PROJECT_DIR), recursive=True); obs.start()
         try:
             while True: time.sleep(0.5)
         except KeyboardInterrupt: pass
         finally:
-            obs.stop(); obs.join(); _stop()
+            obs.stop(); obs.join()
+            if h._t: h._t.cancel()
+            # A _fire already running holds the lock: let its restart finish, then stop
+            with h._lock:
+                h._closed=True
+                _stop()
     else:
         print("⚠️ watchdog not installed; using polling every 500ms.")
-        snap=_snapshot()
+        tree={str(PROJECT_DIR): (None, [])}
+        _update_tree(tree)
+        snap=_snapshot(tree)
         try:
             while True:
                 time.sleep(0.5)
-                cur=_snapshot()
+                _update_tree(tree)
+                cur=_snapshot(tree)
                 if cur!=snap:
                     snap=cur
                     print("🔁 Change detected.")
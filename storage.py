@@ -3,43 +3,125 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import stat
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
+
+# Faster index (de)serialization when orjson is installed; stdlib json otherwise
+try:
+    import orjson  # pip install orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except Exception:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 # App archive folder: ~/Documents/FilePulse/Reports
 APP_DIR = Path.home() / "Documents" / "FilePulse" / "Reports"
-INDEX = APP_DIR / "index.json"
+INDEX_JSONL = APP_DIR / "index.jsonl"   # append-only: one JSON record per line
+INDEX = APP_DIR / "index.json"          # legacy whole-list index (migrated once)
+
+# The Reports tab loader and the export worker call in from different threads;
+# migrate / rewrite / append hold this (re-entrant: they call ensure_repo).
+_INDEX_LOCK = threading.RLock()
 
 
 # ---------------- basics ----------------
 
 def ensure_repo() -> Path:
     """
-    Ensure the archive folder and index.json exist.
+    Ensure the archive folder and index.jsonl exist
+    (migrating a legacy index.json on first run).
     Returns the archive Path.
     """
     APP_DIR.mkdir(parents=True, exist_ok=True)
-    if not INDEX.exists():
-        INDEX.write_text("[]", encoding="utf-8")
+    if not INDEX_JSONL.exists():
+        with _INDEX_LOCK:
+            if not INDEX_JSONL.exists():  # another thread may have migrated meanwhile
+                items: List[Dict] = []
+                if INDEX.exists():
+                    try:
+                        items = _loads(INDEX.read_bytes())
+                    except Exception:
+                        items = []
+                _write_index(items)
+                INDEX.unlink(missing_ok=True)
     return APP_DIR
 
 
 def _load_index() -> List[Dict]:
-    ensure_repo()
+    return list(iter_reports())
+
+
+def _write_index(items: List[Dict]) -> None:
+    # Write a uniquely named temp file and swap it in, so a crash never leaves a
+    # torn index. Caller holds _INDEX_LOCK.
+    fd, tmp = tempfile.mkstemp(dir=APP_DIR, prefix="index.", suffix=".jsonl.tmp")
     try:
-        return json.loads(INDEX.read_text(encoding="utf-8"))
-    except Exception:
-        return []
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"".join(_dumps(it) + b"\n" for it in items))
+        os.replace(tmp, INDEX_JSONL)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def _save_index(items: List[Dict]) -> None:
-    ensure_repo()
-    INDEX.write_text(json.dumps(items, indent=2), encoding="utf-8")
+    """Rewrite the whole index (rebuild/delete); new reports use _append_index."""
+    with _INDEX_LOCK:
+        ensure_repo()
+        _write_index(items)
+
+
+def _append_index(item: Dict) -> None:
+    with _INDEX_LOCK:
+        ensure_repo()
+        with open(INDEX_JSONL, "ab") as f:
+            f.write(_dumps(item) + b"\n")
 
 
 # ---------------- saving ----------------
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy src -> dst (data + timestamps) using the OS copy path where possible.
+    Hardlinks are avoided on purpose: re-exporting to the same source path
+    would rewrite the archived copy through the shared inode.
+    """
+    if os.name == "nt":
+        try:
+            import ctypes
+            # Kernel-side copy; keeps timestamps/attributes like copy2. Fail if dst exists.
+            if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), True):
+                return
+        except Exception:
+            pass
+    else:
+        try:
+            import fcntl
+            FICLONE = 0x40049409  # copy-on-write clone (btrfs/xfs); no bytes copied
+            with open(src, "rb") as fs, open(dst, "wb") as fd:
+                fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+            shutil.copystat(src, dst)
+            return
+        except Exception:
+            pass  # not a CoW filesystem / cross-device: copy2 overwrites dst below
+    shutil.copy2(src, dst)
+
+
 def _unique_dest(preferred_name: str) -> Path:
     """
     Return a unique path inside APP_DIR using the same filename
@@ -58,8 +140,16 @@ def _unique_dest(preferred_name: str) -> Path:
     else:
         stem, ext = base[:dot], base[dot:]
 
-    candidate = APP_DIR / f"{stem}{ext}"
+    # One directory listing + set lookups instead of an exists() stat per try
+    existing = set(os.listdir(APP_DIR))
+    name = f"{stem}{ext}"
     n = 2
+    while name in existing:
+        name = f"{stem} ({n}){ext}"
+        n += 1
+
+    # The folder may have changed since the listing; re-check on disk
+    candidate = APP_DIR / name
     while candidate.exists():
         candidate = APP_DIR / f"{stem} ({n}){ext}"
         n += 1
@@ -71,7 +161,7 @@ def save_report_copy(src_pdf_path: str, title_hint: str | None = None) -> str:
     Copy an existing PDF into the archive using the SAME filename
     the user saved. If a clash occurs, auto-dedupe with ' (2)', ' (3)', ...
 
-    Also appends a record to index.json.
+    Also appends a record to index.jsonl.
 
     Returns the absolute path to the archived copy.
     """
@@ -81,7 +171,7 @@ def save_report_copy(src_pdf_path: str, title_hint: str | None = None) -> str:
         raise FileNotFoundError(f"Source PDF not found: {src_pdf_path}")
 
     dst = _unique_dest(src.name)
-    shutil.copy2(src, dst)
+    _fast_copy(src, dst)
 
     item = {
         "ts": int(time.time()),           # when archived (epoch seconds)
@@ -91,14 +181,31 @@ def save_report_copy(src_pdf_path: str, title_hint: str | None = None) -> str:
         "path": str(dst),                 # absolute path to archived copy
         "original_name": src.name,        # what the user chose when saving
     }
-    items = _load_index()
-    items.append(item)
-    _save_index(items)
+    _append_index(item)  # O(1): no read + rewrite of the whole index
     return str(dst)
 
 
 # ---------------- listing ----------------
 
+def iter_reports() -> Iterator[Dict]:
+    """
+    Yield index records one line at a time, in archive order (unsorted).
+    Use list_reports() for the newest-first list with rebuild-from-disk.
+    """
+    ensure_repo()
+    try:
+        with open(INDEX_JSONL, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except Exception:
+                    pass  # skip a torn/corrupt line, keep the rest
+    except OSError:
+        pass
+
+
 def list_reports() -> List[Dict]:
     """
     Return all archived reports sorted newest-first.
@@ -108,21 +215,31 @@ def list_reports() -> List[Dict]:
     items = _load_index()
 
     if not items:
-        # Rebuild from existing PDFs if any (best-effort)
-        for p in APP_DIR.glob("*.pdf"):
-            try:
-                st = p.stat()
-            except OSError:
-                continue
-            items.append({
-                "ts": int(st.st_mtime),
-                "name": p.name,
-                "title": p.stem,
-                "size": st.st_size,
-                "path": str(p),
-                "original_name": p.name,
-            })
-        _save_index(items)
+        with _INDEX_LOCK:
+            # Re-check under the lock: a concurrent save may have just appended
+            items = _load_index()
+            if not items:
+                # Rebuild from existing PDFs if any (best-effort).
+                # One scandir pass, one stat per entry, plain strings (no Path objects).
+                with os.scandir(APP_DIR) as it:
+                    for e in it:
+                        if not e.name.lower().endswith(".pdf"):
+                            continue
+                        try:
+                            st = e.stat()
+                        except OSError:
+                            continue
+                        if not stat.S_ISREG(st.st_mode):
+                            continue
+                        items.append({
+                            "ts": int(st.st_mtime),
+                            "name": e.name,
+                            "title": e.name[:-4],
+                            "size": st.st_size,
+                            "path": e.path,
+                            "original_name": e.name,
+                        })
+                _save_index(items)
 
     items.sort(key=lambda x: x.get("ts", 0), reverse=True)
     return items
@@ -132,7 +249,7 @@ def list_reports() -> List[Dict]:
 
 def delete_report(path_or_name: str) -> bool:
     """
-    Delete a report both from disk and index.json.
+    Delete a report both from disk and the index.
     Accepts either the absolute path or the filename inside APP_DIR.
     Returns True if something was deleted.
     """
@@ -150,11 +267,12 @@ def delete_report(path_or_name: str) -> bool:
     except Exception:
         pass
 
-    # Update index
-    items = _load_index()
-    new_items = [it for it in items if Path(it.get("path", "")) != p]
-    if len(new_items) != len(items):
-        _save_index(new_items)
-        deleted = True
+    # Update index (read-filter-rewrite must not interleave with an append)
+    with _INDEX_LOCK:
+        items = _load_index()
+        new_items = [it for it in items if Path(it.get("path", "")) != p]
+        if len(new_items) != len(items):
+            _save_index(new_items)
+            deleted = True
 
     return deleted
@@ -1,6 +1,12 @@
+import json
 import os
+import queue
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+from typing import Iterator
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -8,14 +14,37 @@ import config
 import storage
 from preview import FilePreview  # renders the table (HTML or Treeview)
 
+# Folder sizes survive restarts: [[path, dir mtime_ns, size], ...]
+SIZE_CACHE = Path.home() / "Documents" / "FilePulse" / ".size_cache.json"
+
+_WINDOWS = os.name == "nt"
+
 
 class TabOne(ttk.Frame):
     def __init__(self, parent) -> None:
         super().__init__(parent)
         self._folders: list[str] = []   # selected folders
+        self._folder_set: set[str] = set()  # same paths, for O(1) duplicate checks
         self._rows: list[dict] = []     # one row per folder
+        self._executor = ThreadPoolExecutor(max_workers=4)  # Add Folder scans run here
+        self._size_cache: dict[tuple[str, int], int] = _load_size_cache()
+        self._size_lock = threading.Lock()  # scan workers and the Tk thread share the cache
+        self._pending_render: str | None = None  # after() id of a queued recompute
+        self._thresholds = config.get_thresholds()  # kept current by the callback below
+        self._closing = False
         self._build_ui()
-        config.register_callback(lambda *_: self._recompute_states_and_render())
+        config.register_callback(self._on_thresholds_changed)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_destroy(self, event) -> None:
+        if event.widget is not self:
+            return  # <Destroy> also arrives for every child widget
+        # Stop in-flight walks so closing the window doesn't leave the process
+        # running until a big folder finishes
+        self._closing = True
+        _SCAN_CANCEL.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        _shutdown_size_pool()
 
     def _build_ui(self) -> None:
         # Toolbar
@@ -25,6 +54,7 @@ class TabOne(ttk.Frame):
         ttk.Button(bar, text="Add Folder", command=self._on_add_folder).pack(
             side="left", padx=(10, 8), pady=10
         )
+        ttk.Button(bar, text="Rescan", command=self._on_rescan).pack(side="left", padx=(0, 8))
         self._count_var = tk.StringVar(value="Folders: 0")
         ttk.Label(bar, textvariable=self._count_var).pack(side="left", padx=(0, 10))
 
@@ -42,7 +72,8 @@ class TabOne(ttk.Frame):
         # Generate button (always visible)
         btn_row = ttk.Frame(body)
         btn_row.grid(row=1, column=0, sticky="e", padx=10, pady=(0, 10))
-        ttk.Button(btn_row, text="Generate", command=self._on_generate).pack()
+        self._gen_btn = ttk.Button(btn_row, text="Generate", command=self._on_generate)
+        self._gen_btn.pack()
 
         self._render()
 
@@ -51,20 +82,81 @@ class TabOne(ttk.Frame):
         if not folder:
             return
         folder = os.path.normpath(folder)
-        if folder in self._folders:
+        if folder in self._folder_set:
             messagebox.showinfo("Already added", "This folder is already in the list.")
             return
 
+        self._folder_set.add(folder)
         self._folders.append(folder)
-        row = self._folder_row(folder)
-        if not any(r["file_path"] == row["file_path"] for r in self._rows):
-            self._rows.append(row)
+        # Show the folder right away; the (possibly slow) walk runs on a worker and
+        # its row replaces this placeholder back on the Tk thread.
+        row = {
+            "file_path": folder,
+            "file_size": None,
+            "last_modified": "—",
+            "last_worked_by": "—",
+            "file_name": os.path.basename(folder) or folder,
+            "file_neglect_time": "—",
+            "neglect_seconds": None,
+            "file_state": "amber",
+            "pending": True,
+        }
+        self._rows.append(row)
+        # Only one row is new: append it instead of re-rendering the whole table
+        self._preview.append_row(row)
+        self._count_var.set(f"Folders: {len(self._folders)}")
+        self._start_scan(folder)
+
+    def _on_rescan(self) -> None:
+        # The cache only sees the top folder's mtime; edits deeper down need a manual rescan
+        now_ts = time.time()  # one "now" for the whole batch of rows
+        for r in self._rows:
+            if r.get("pending"):
+                continue
+            folder = r["file_path"]
+            with self._size_lock:
+                self._drop_cached_size(folder)
+            r["pending"] = True
+            self._start_scan(folder, now_ts)
+
+    def _start_scan(self, folder: str, now_ts: float | None = None) -> None:
+        self._executor.submit(self._folder_row, folder, now_ts).add_done_callback(
+            lambda fut: self._post_finalize(folder, fut)
+        )
+
+    def _post_finalize(self, folder: str, fut) -> None:
+        # Runs on the worker; the widget may be gone by the time the walk ends
+        if self._closing:
+            return
+        try:
+            self.after(0, self._finalize_row, folder, fut)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _finalize_row(self, folder: str, fut) -> None:
+        try:
+            row = fut.result()
+        except Exception:
+            row = None
+        for i, r in enumerate(self._rows):
+            if r["file_path"] == folder and r.get("pending"):
+                if row is None:
+                    # Scan blew up: drop the placeholder so the folder can be re-added
+                    del self._rows[i]
+                    self._folders.remove(folder)
+                    self._folder_set.discard(folder)
+                else:
+                    self._rows[i] = row
+                break
         self._render()
 
     def _on_generate(self) -> None:
         if not self._rows:
             messagebox.showinfo("Nothing to export", "Please add at least one folder.")
             return
+        if any(r.get("pending") for r in self._rows):
+            messagebox.showinfo("Still scanning", "Folder sizes are still being computed. Try again in a moment.")
+            return
         # Let the user pick their own save path
         fpath = filedialog.asksaveasfilename(
             title="Save PDF",
@@ -74,37 +166,95 @@ class TabOne(ttk.Frame):
         )
         if not fpath:
             return
-        try:
-            # 1) Write the chosen PDF
-            self._preview.export_pdf(fpath, self._rows)
-
-            # 2) Also archive a copy in ~/Documents/FilePulse/Reports
-            # use the first folder's name (or "report") as hint
-            title_hint = os.path.basename(self._rows[0].get("file_name") or "report")
-            archived = storage.save_report_copy(fpath, title_hint=title_hint)
-
-            messagebox.showinfo(
-                "Saved",
-                f"PDF saved:\n{fpath}\n\nArchived copy:\n{archived}"
-            )
-        except Exception as e:
-            messagebox.showerror("Export failed", f"Couldn't create PDF:\n{e}")
-    # --- helpers (unchanged) ---
-    def _folder_row(self, folder: str) -> dict:
+        # Export + archive run on a worker; the dialog polls its progress queue
+        rows = [dict(r) for r in self._rows]  # snapshot: scans/recomputes may edit _rows
+        total = len(rows)
+        q: queue.Queue = queue.Queue()
+        cancel = threading.Event()
+
+        def on_progress(done: int) -> None:
+            if cancel.is_set():
+                raise _ExportCancelled()
+            q.put(("progress", done))
+
+        def work() -> None:
+            try:
+                # 1) Write the chosen PDF
+                self._preview.export_pdf(fpath, rows, progress=on_progress)
+
+                # 2) Also archive a copy in ~/Documents/FilePulse/Reports
+                # use the first folder's name (or "report") as hint
+                title_hint = os.path.basename(rows[0].get("file_name") or "report")
+                archived = storage.save_report_copy(fpath, title_hint=title_hint)
+                q.put(("done", archived))
+            except _ExportCancelled:
+                q.put(("cancelled", None))
+            except Exception as e:
+                q.put(("error", e))
+
+        dlg = tk.Toplevel(self)
+        dlg.title("Generating PDF")
+        dlg.transient(self.winfo_toplevel())
+        dlg.resizable(False, False)
+        status = tk.StringVar(value=f"Writing rows: 0 / {total}")
+        ttk.Label(dlg, textvariable=status).pack(padx=16, pady=(14, 6), anchor="w")
+        bar = ttk.Progressbar(dlg, length=320, mode="determinate", maximum=max(1, total))
+        bar.pack(padx=16, pady=(0, 8))
+        ttk.Button(dlg, text="Cancel", command=cancel.set).pack(pady=(0, 12))
+        dlg.protocol("WM_DELETE_WINDOW", cancel.set)
+        self._gen_btn.state(["disabled"])
+
+        def finish() -> None:
+            dlg.destroy()
+            self._gen_btn.state(["!disabled"])
+
+        def poll() -> None:
+            try:
+                while True:
+                    kind, val = q.get_nowait()
+                    if kind == "progress":
+                        bar["value"] = val
+                        status.set(f"Writing rows: {val} / {total}")
+                        continue
+                    finish()
+                    if kind == "done":
+                        messagebox.showinfo(
+                            "Saved",
+                            f"PDF saved:\n{fpath}\n\nArchived copy:\n{val}"
+                        )
+                        with self._size_lock:
+                            snapshot = dict(self._size_cache)
+                        _save_size_cache(snapshot)
+                    elif kind == "error":
+                        messagebox.showerror("Export failed", f"Couldn't create PDF:\n{val}")
+                    return
+            except queue.Empty:
+                pass
+            self.after(50, poll)
+
+        threading.Thread(target=work, daemon=True).start()
+        self.after(50, poll)
+
+    # --- helpers ---
+    def _folder_row(self, folder: str, now_ts: float | None = None) -> dict:
         try:
             st = os.stat(folder)
             last_modified_ts = st.st_mtime
             last_modified_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_modified_ts))
+            root_mtime_ns = st.st_mtime_ns
         except OSError:
             last_modified_ts = None
             last_modified_str = "—"
+            root_mtime_ns = None
 
-        total_size = self._folder_size_bytes(folder)
+        # Reuse this stat for the size-cache key instead of statting the root again
+        total_size = self._folder_size_bytes(folder, root_mtime_ns=root_mtime_ns)
 
         neglect_seconds = None
         neglect_str = "—"
         if last_modified_ts is not None:
-            now_ts = datetime.now(timezone.utc).timestamp()
+            if now_ts is None:
+                now_ts = time.time()  # same epoch seconds, without building a datetime
             neglect_seconds = max(0, int(now_ts - last_modified_ts))
             neglect_str = _format_duration(neglect_seconds)
 
@@ -121,11 +271,12 @@ class TabOne(ttk.Frame):
             "file_state": state,
         }
 
-    def _compute_state(self, neglect_seconds: int | None) -> str:
+    def _compute_state(self, neglect_seconds: int | None,
+                       thresholds: tuple[int, int, int] | None = None) -> str:
         if neglect_seconds is None:
             return "red"
         days = neglect_seconds // 86400
-        g, a, r = config.get_thresholds()
+        g, a, r = thresholds or self._thresholds
         if days <= g:
             return "green"
         elif days <= a:
@@ -133,32 +284,61 @@ class TabOne(ttk.Frame):
         else:
             return "red"
 
+    def _on_thresholds_changed(self, green: int, amber: int, red: int) -> None:
+        self._thresholds = (green, amber, red)
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        # Collapse a burst of threshold changes into one recompute 100 ms after the last
+        if self._pending_render:
+            self.after_cancel(self._pending_render)
+        self._pending_render = self.after(100, self._recompute_states_and_render)
+
     def _recompute_states_and_render(self) -> None:
+        self._pending_render = None
+        thresholds = self._thresholds
         for r in self._rows:
-            r["file_state"] = self._compute_state(r.get("neglect_seconds"))
+            if not r.get("pending"):
+                r["file_state"] = self._compute_state(r.get("neglect_seconds"), thresholds)
         self._render()
 
-    def _folder_size_bytes(self, folder: str) -> int | None:
-        total = 0
+    def _folder_size_bytes(self, folder: str, root_mtime_ns: int | None = None) -> int | None:
+        if root_mtime_ns is None:
+            try:
+                root_mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                pass
+        key = None if root_mtime_ns is None else (folder, root_mtime_ns)
+        with self._size_lock:
+            cached = self._size_cache.get(key)
+        if cached is not None:
+            return cached
+        total = self._walk_folder(folder)
+        if key is not None and total is not None:
+            with self._size_lock:
+                self._drop_cached_size(folder)  # superseded mtime
+                self._size_cache[key] = total
+        return total
+
+    def _drop_cached_size(self, folder: str) -> None:
+        # Caller holds self._size_lock
+        for key in [k for k in self._size_cache if k[0] == folder]:
+            del self._size_cache[key]
+
+    def _walk_folder(self, folder: str) -> int | None:
+        # Files at the top level are summed here; each top-level subdirectory is
+        # walked on the shared pool so per-directory I/O latency overlaps.
+        dirs: list[str] = []
         try:
-            stack = [folder]
-            while stack:
-                cur = stack.pop()
-                try:
-                    with os.scandir(cur) as it:
-                        for entry in it:
-                            try:
-                                if entry.is_dir(follow_symlinks=False):
-                                    stack.append(entry.path)
-                                elif entry.is_file(follow_symlinks=False):
-                                    try:
-                                        total += entry.stat(follow_symlinks=False).st_size
-                                    except OSError:
-                                        pass
-                            except OSError:
-                                pass
-                except OSError:
-                    pass
+            total = _scan_level(folder, dirs)
+            if len(dirs) == 1:
+                total += _walk_subtree(dirs[0])
+            elif dirs:
+                futures = [_size_pool().submit(_walk_subtree, d) for d in dirs]
+                for fut in as_completed(futures):
+                    total += fut.result()
+            if _SCAN_CANCEL.is_set():
+                return None  # partial total; never cache it
             return total
         except Exception:
             return None
@@ -168,19 +348,130 @@ class TabOne(ttk.Frame):
         self._preview.render(self._rows)
 
 
+class _ExportCancelled(Exception):
+    """Raised from the export progress callback when the user hits Cancel."""
+
+
+def _load_size_cache() -> dict[tuple[str, int], int]:
+    try:
+        with open(SIZE_CACHE, "r", encoding="utf-8") as f:
+            return {(p, int(m)): int(n) for p, m, n in json.load(f)}
+    except Exception:
+        return {}
+
+
+def _save_size_cache(cache: dict[tuple[str, int], int]) -> None:
+    try:
+        SIZE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SIZE_CACHE.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([[p, m, n] for (p, m), n in list(cache.items())], f)
+        os.replace(tmp, SIZE_CACHE)
+    except OSError:
+        pass
+
+
+_SIZE_POOL: ThreadPoolExecutor | None = None
+_SIZE_POOL_LOCK = threading.Lock()
+_SCAN_CANCEL = threading.Event()  # set on shutdown; walks stop at the next entry
+
+
+def _size_pool() -> ThreadPoolExecutor:
+    # One pool for the app's lifetime; repeated Add Folder calls reuse its threads
+    global _SIZE_POOL
+    with _SIZE_POOL_LOCK:  # several scan workers may ask for it at once
+        if _SIZE_POOL is None:
+            _SIZE_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4),
+                                            thread_name_prefix="folder-size")
+        return _SIZE_POOL
+
+
+def _shutdown_size_pool() -> None:
+    global _SIZE_POOL
+    with _SIZE_POOL_LOCK:
+        if _SIZE_POOL is not None:
+            _SIZE_POOL.shutdown(wait=False, cancel_futures=True)
+            _SIZE_POOL = None
+
+
+def _scan_level(path: str, dirs: list[str]) -> int:
+    """Bytes in the regular files directly inside path; subdirectories go to dirs."""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if _SCAN_CANCEL.is_set():
+                    break
+                try:
+                    if _WINDOWS:
+                        # FindFirstFile already filled in the stat: one dispatch, no syscall
+                        st = entry.stat(follow_symlinks=False)
+                        if S_ISDIR(st.st_mode):
+                            dirs.append(entry.path)
+                        elif S_ISREG(st.st_mode):
+                            total += st.st_size
+                    elif entry.is_dir(follow_symlinks=False):  # d_type, no syscall
+                        dirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):  # symlinks never stat'd
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return total
+
+
+def _walk_sizes(root: str) -> Iterator[int]:
+    """
+    Yield the size of every regular file under root, depth-first (symlinks not followed).
+    Holds one open scandir iterator per level instead of a list of every pending path.
+    """
+    try:
+        its = [os.scandir(root)]
+    except OSError:
+        return
+    try:
+        while its:
+            if _SCAN_CANCEL.is_set():
+                return
+            try:
+                entry = next(its[-1])
+            except (StopIteration, OSError):
+                its.pop().close()
+                continue
+            try:
+                if _WINDOWS:
+                    st = entry.stat(follow_symlinks=False)
+                    if S_ISDIR(st.st_mode):
+                        its.append(os.scandir(entry.path))
+                    elif S_ISREG(st.st_mode):
+                        yield st.st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    its.append(os.scandir(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+    finally:
+        for it in its:
+            it.close()
+
+
+def _walk_subtree(root: str) -> int:
+    """Total size in bytes of the regular files under root (symlinks not followed)."""
+    return sum(_walk_sizes(root))
+
+
 def _format_duration(seconds: int) -> str:
     if seconds <= 0:
         return "0s"
-    parts = []
-    days, rem = divmod(seconds, 86400)
-    if days:
-        parts.append(f"{days}d")
-    hours, rem = divmod(rem, 3600)
-    if hours:
-        parts.append(f"{hours}h")
-    minutes, rem = divmod(rem, 60)
-    if minutes:
-        parts.append(f"{minutes}m")
-    if not parts:
-        parts.append(f"{rem}s")
-    return " ".join(parts)
+    d, s = divmod(seconds, 86400)
+    h, s = divmod(s, 3600)
+    m, s = divmod(s, 60)
+    # Seconds only show when there's nothing bigger
+    return " ".join(x for x in (
+        f"{d}d" if d else "",
+        f"{h}h" if h else "",
+        f"{m}m" if m else "",
+        "" if (d or h or m) else f"{s}s",
+    ) if x)
@@ -3,10 +3,36 @@ from __future__ import annotations
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox
+import queue
 import subprocess
+import threading
 import time
+from functools import lru_cache
 
 import storage
+from preview import _human_size
+
+_PAGE = 200  # rows inserted per batch; more are added as the user scrolls down
+
+
+def human_size(n) -> str:
+    # Same units as the preview; this list has always shown '-' for unknown sizes
+    s = _human_size(n)
+    return "-" if s == "—" else s
+
+
+def _ts_int(ts) -> int:
+    # One malformed record (null / non-numeric ts) mustn't hide the whole archive
+    try:
+        return int(ts or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts: int) -> str:
+    # Refresh re-formats the same archive timestamps every time
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
 
 
 class TabTwo(ttk.Frame):
@@ -18,6 +44,11 @@ class TabTwo(ttk.Frame):
     def __init__(self, parent) -> None:
         super().__init__(parent)
         self._build_ui()
+        # Defer reading the archive until the tab is first shown (keeps startup cheap)
+        self._map_bind = self.bind("<Map>", self._on_first_map, add="+")
+
+    def _on_first_map(self, _event=None) -> None:
+        self.unbind("<Map>", self._map_bind)
         self._load_rows()
 
     def _build_ui(self) -> None:
@@ -37,7 +68,14 @@ class TabTwo(ttk.Frame):
 
         sb = ttk.Scrollbar(wrap, orient="vertical", command=self._tree.yview)
         sb.pack(side="right", fill="y")
-        self._tree.configure(yscrollcommand=sb.set)
+        self._sb = sb
+        self._tree.configure(yscrollcommand=self._on_yscroll)
+
+        self._rows: list[tuple] = []  # every formatted row; only the first _shown are inserted
+        self._shown = 0
+        self._load_gen = 0  # bumped per load; stale background results are dropped
+        self._load_q: queue.Queue = queue.Queue()
+        self._load_polling = False
 
         self._tree.heading("title", text="Title")
         self._tree.heading("when", text="Saved at")
@@ -50,28 +88,85 @@ class TabTwo(ttk.Frame):
         self._tree.column("path", width=520, anchor="w")
 
     def _load_rows(self) -> None:
+        # Read + format the archive on a worker; results come back through a
+        # queue polled on the Tk thread (the worker never touches Tk itself)
+        self._load_gen += 1
+        threading.Thread(target=self._bg_load, args=(self._load_gen,), daemon=True).start()
+        if not self._load_polling:
+            self._load_polling = True
+            self.after(50, self._poll_load)
+
+    def _bg_load(self, gen: int) -> None:
         try:
-            items = storage.list_reports()
+            rows = [
+                (it.get("title",""), _fmt_ts(_ts_int(it.get("ts"))), human_size(it.get("size", 0)), it.get("path",""))
+                for it in storage.list_reports()
+            ]
         except Exception as e:
-            messagebox.showerror("Error", f"Couldn't load archive:\n{e}")
+            self._load_q.put((gen, None, e))
             return
-        self._tree.delete(*self._tree.get_children())
+        self._load_q.put((gen, rows, None))
 
-        def human_size(n):
-            try:
-                n = int(n)
-            except Exception:
-                return "-"
-            units = ["B","KB","MB","GB","TB"]
-            i = 0; f = float(n)
-            while f >= 1024 and i < len(units)-1:
-                f /= 1024.0; i += 1
-            return f"{f:.1f} {units[i]}"
-
-        for it in items:
-            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(it.get("ts", 0)))
-            size = human_size(it.get("size", 0))
-            self._tree.insert("", "end", values=(it.get("title",""), when, size, it.get("path","")))
+    def _poll_load(self) -> None:
+        try:
+            while True:
+                gen, rows, err = self._load_q.get_nowait()
+                if gen != self._load_gen:
+                    continue  # a newer Refresh is already on its way
+                self._load_polling = False
+                if err is not None:
+                    messagebox.showerror("Error", f"Couldn't load archive:\n{err}")
+                else:
+                    self._show_rows(gen, rows)
+                return
+        except queue.Empty:
+            pass
+        self.after(50, self._poll_load)
+
+    def _show_rows(self, gen: int, rows: list[tuple]) -> None:
+        if gen != self._load_gen:
+            return  # a newer Refresh is already on its way
+        self._rows = rows
+        # Keep as many rows attached as before (at least one page) so Refresh
+        # doesn't cut the list the user had scrolled through
+        end = min(len(rows), max(self._shown, _PAGE))
+        # Reconcile with the tree by path, with the tree out of the layout (and the
+        # scrollbar unhooked) so Tk doesn't relayout/redraw per item: reports that
+        # are still there keep their item, only the delta is inserted/deleted.
+        tree = self._tree
+        tree.configure(yscrollcommand="")
+        tree.pack_forget()
+        # path -> item ids: the index can hold several records for one path
+        # (an archived PDF deleted outside the app and its name reused)
+        existing: dict[str, list[str]] = {}
+        for cid in tree.get_children():
+            existing.setdefault(tree.set(cid, "path"), []).append(cid)
+        for idx, vals in enumerate(rows[:end]):
+            cids = existing.get(vals[3])
+            if cids:
+                cid = cids.pop(0)
+                tree.item(cid, values=vals)
+                tree.move(cid, "", idx)
+            else:
+                tree.insert("", idx, values=vals)
+        stale = [cid for cids in existing.values() for cid in cids]
+        if stale:
+            tree.delete(*stale)
+        self._shown = end
+        tree.pack(side="left", fill="both", expand=True, before=self._sb)
+        tree.configure(yscrollcommand=self._on_yscroll)
+
+    def _insert_page(self) -> None:
+        end = min(len(self._rows), self._shown + _PAGE)
+        for vals in self._rows[self._shown:end]:
+            self._tree.insert("", "end", values=vals)
+        self._shown = end
+
+    def _on_yscroll(self, first, last) -> None:
+        self._sb.set(first, last)
+        # Reached the bottom of what's inserted: append the next page
+        if self._shown < len(self._rows) and float(last) >= 1.0:
+            self._insert_page()
 
     def _selected_path(self) -> str | None:
         sel = self._tree.selection()
@@ -103,7 +198,8 @@ class TabTwo(ttk.Frame):
             messagebox.showerror("Show in Folder", "Folder no longer exists.")
             return
         try:
-            subprocess.Popen(f'explorer /select,"{path}"')
+            # argv form: CreateProcess gets the path quoted correctly, whatever it contains
+            subprocess.Popen(["explorer", "/select,", os.path.normpath(path)])
         except Exception:
             try:
                 os.startfile(folder)
@@ -65,16 +65,14 @@ class TabThree(ttk.Frame):
         self.red_var.set(str(r))
 
     def _on_save(self) -> None:
-        try:
-            g = int(self.green_var.get())
-            a = int(self.amber_var.get())
-            r = int(self.red_var.get())
-            if g < 0 or a < 0 or r < 0:
-                raise ValueError("Values must be non-negative.")
-            if not (g <= a <= r):
-                raise ValueError("Must satisfy: Green ≤ Amber ≤ Red.")
-        except Exception as e:
-            messagebox.showerror("Invalid thresholds", str(e))
+        vals = [v.get().strip() for v in (self.green_var, self.amber_var, self.red_var)]
+        # isdecimal (not isdigit): exactly the characters int() accepts, e.g. no '²'
+        if not all(s.isdecimal() for s in vals):
+            messagebox.showerror("Invalid thresholds", "Values must be non-negative whole numbers.")
+            return
+        g, a, r = map(int, vals)
+        if not (g <= a <= r):
+            messagebox.showerror("Invalid thresholds", "Must satisfy: Green ≤ Amber ≤ Red.")
             return
 
         config.set_thresholds(g, a, r)